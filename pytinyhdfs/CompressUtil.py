@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+from __future__ import with_statement
+
+import os
+import gzip
+
+try:
+    import bz2
+except ImportError:
+    bz2 = None
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import lz4.frame as lz4frame
+except ImportError:
+    lz4frame = None
+
+CHUNK_SIZE = 1024 * 1024
+
+
+class CompressorWriter(object):
+
+    def __init__(self, compressor, fileobj):
+        self.compressor = compressor
+        self.fileobj = fileobj
+
+    def write(self, data):
+        block = self.compressor.compress(data)
+        if block:
+            self.fileobj.write(block)
+
+    def close(self):
+        block = self.compressor.flush()
+        if block:
+            self.fileobj.write(block)
+
+
+def _open_gzip(fileobj, level, threads):
+    return gzip.GzipFile('', mode='wb', compresslevel=level, fileobj=fileobj)
+
+
+def _open_bzip2(fileobj, level, threads):
+    return CompressorWriter(bz2.BZ2Compressor(level), fileobj)
+
+
+def _open_lzma(fileobj, level, threads):
+    return CompressorWriter(lzma.LZMACompressor(preset=level), fileobj)
+
+
+def _open_zstd(fileobj, level, threads):
+    compressor = zstandard.ZstdCompressor(level=level, threads=threads)
+    return CompressorWriter(compressor.compressobj(), fileobj)
+
+
+def _open_lz4(fileobj, level, threads):
+    return lz4frame.LZ4FrameFile(fileobj, mode='wb', compression_level=level)
+
+
+# name: (suffix, min level, max level, default level, module, opener)
+CODECS = {
+    'gzip': ('.gz', 1, 9, 9, gzip, _open_gzip),
+    'bzip2': ('.bz2', 1, 9, 9, bz2, _open_bzip2),
+    'lzma': ('.xz', 0, 9, 6, lzma, _open_lzma),
+    'zstd': ('.zst', 1, 22, 3, zstandard, _open_zstd),
+    'lz4': ('.lz4', 0, 16, 0, lz4frame, _open_lz4),
+}
+
+MODULES = {
+    'gzip': 'gzip',
+    'bzip2': 'bz2',
+    'lzma': 'lzma',
+    'zstd': 'zstandard',
+    'lz4': 'lz4',
+}
+
+
+class CompressUtil(object):
+
+    @staticmethod
+    def codecs():
+        return sorted(CODECS.keys())
+
+    @staticmethod
+    def available(codec):
+        return codec in CODECS and CODECS[codec][4] is not None
+
+    @staticmethod
+    def suffix(codec):
+        return CODECS[codec][0]
+
+    @staticmethod
+    def suffixes():
+        return [v[0] for v in CODECS.values()]
+
+    @staticmethod
+    def parse(value):
+        if ':' in value:
+            codec, level = value.split(':', 1)
+        else:
+            codec, level = value, None
+        codec = codec.strip().lower()
+        if codec not in CODECS:
+            raise Exception("Unsupported compress codec <%s>, choices: %s" %
+                            (codec, ", ".join(CompressUtil.codecs())))
+        if not CompressUtil.available(codec):
+            raise Exception("Compress codec <%s> requires module \"%s\"" %
+                            (codec, MODULES[codec]))
+        _, min_level, max_level, default_level, _, _ = CODECS[codec]
+        if level is None or len(level.strip()) < 1:
+            level = default_level
+        else:
+            try:
+                level = int(level)
+            except ValueError:
+                raise Exception("Invalid compress level <%s>" % level)
+            if level < min_level or level > max_level:
+                raise Exception("Compress codec <%s> level must be %d-%d" %
+                                (codec, min_level, max_level))
+        return codec, level
+
+    @staticmethod
+    def compress(source_file, codec, level=None, threads=0, delete=False):
+        suffix, _, _, default_level, _, opener = CODECS[codec]
+        if level is None:
+            level = default_level
+        target_file = source_file + suffix
+        successed = False
+        target_created = False
+        try:
+            with open(source_file, "rb") as file_in:
+                with open(target_file, "wb") as file_out:
+                    target_created = True
+                    cfile = opener(file_out, level, threads)
+                    try:
+                        while True:
+                            data = file_in.read(CHUNK_SIZE)
+                            if not data:
+                                break
+                            cfile.write(data)
+                            successed = True
+                    finally:
+                        cfile.close()
+        except Exception:
+            if target_created:
+                os.remove(target_file)
+            raise
+
+        if successed:
+            if delete:
+                os.remove(source_file)
+
+        else:
+            if target_created:
+                os.remove(target_file)
+                target_file = None
+
+        return successed, target_file
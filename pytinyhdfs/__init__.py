@@ -1,4 +1,5 @@
 from .WebHDFS import WebHDFS
 from .GZipUtil import GZipUtil
+from .CompressUtil import CompressUtil
 
-__all__ = [WebHDFS, GZipUtil]
+__all__ = [WebHDFS, GZipUtil, CompressUtil]
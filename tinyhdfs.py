@@ -5,10 +5,11 @@ from __future__ import division, print_function, with_statement
 import re
 import os
 import sys
+import time
 from optparse import *
 
 from pytinyhdfs import WebHDFS
-from pytinyhdfs import GZipUtil
+from pytinyhdfs import CompressUtil
 
 VERSION = "1.1.4"
 
@@ -92,11 +93,25 @@ def _command_put(webhdfs, source_file, target_path, options):
     try:
         upload_file = source_file
         target_file = target_path.rstrip("/") + "/" + source_filename
-        if options.gzip and not upload_file.endswith('.gz'):
-            successed, compressed_file = GZipUtil.compress(upload_file)
+        if options.codec and not upload_file.endswith(
+                tuple(CompressUtil.suffixes())):
+            start = time.time()
+            successed, compressed_file = CompressUtil.compress(
+                upload_file, options.codec, options.level,
+                threads=options.compress_threads)
             if successed:
+                elapsed = max(time.time() - start, 0.001)
+                source_size = os.path.getsize(upload_file)
+                compressed_size = os.path.getsize(compressed_file)
+                print("File: <%s>, Compressed: %s:%d, %s -> %s (%.1f%%), %s/s" % (
+                    source_file, options.codec, options.level,
+                    _format_size(source_size),
+                    _format_size(compressed_size),
+                    compressed_size * 100 / max(source_size, 1),
+                    _format_size(int(source_size / elapsed))))
                 upload_file = compressed_file
-                target_file = target_file + ".gz"
+                target_file = target_file + \
+                    CompressUtil.suffix(options.codec)
         status, reason = webhdfs.putFile(upload_file, target_file,
                                          replication=options.replication,
                                          overwrite=options.overwrite)
@@ -226,6 +241,17 @@ def main():
     def parse_username():
         return os.getenv("USER") or os.getenv("USERNAME") or "root"
 
+    def parse_compress(options):
+        options.codec, options.level = None, None
+        if options.compress:
+            try:
+                options.codec, options.level = CompressUtil.parse(
+                    options.compress)
+            except Exception as e:
+                die("Parameter: " + "{0}".format(e))
+        elif options.gzip:
+            options.codec, options.level = CompressUtil.parse("gzip")
+
     parser = OptionParser("%prog [options] <command>", version=VERSION,
                           description="Tiny client for HDFS, base on WebHDFS")
     parser.add_option("-H", "--host",
@@ -282,7 +308,17 @@ def main():
     group.add_option("-G", "--gzip",
                      action="store_true", dest="gzip",
                      default=False,
-                     help="Try GZip compress before upload, file name append \".gz\"")
+                     help="Try GZip compress before upload, file name append \".gz\", same as --compress gzip")
+    group.add_option("-C", "--compress",
+                     dest="compress",
+                     default=None,
+                     metavar="CODEC[:LEVEL]",
+                     help="Try compress before upload, file name append codec suffix, codecs: %s" %
+                     ", ".join(filter(CompressUtil.available, CompressUtil.codecs())))
+    group.add_option("--compress-threads",
+                     type="int", dest="compress_threads",
+                     default=0,
+                     help="The compress worker threads, only for zstd, -1 as CPU count, default: 0")
     group.add_option("-D", "--delete-source",
                      action="store_true", dest="delete_source",
                      default=False,
@@ -297,6 +333,7 @@ def main():
     (options, args) = parser.parse_args(sys_argv)
     if not options.host:
         die("lost options: -H or --host or env[\"TINYHDFS_HOST\"]")
+    parse_compress(options)
 
     args = args[1:]
     webhdfs = WebHDFS(options.host, options.port, options.user,